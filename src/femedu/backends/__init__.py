@@ -0,0 +1,6 @@
+"""
+Optional compute backends for element kernels.
+
+Backends depend on packages that are not required by FEM.edu and are therefore
+not imported by default.  See, e.g., :py:meth:`femedu.elements.finite.Triangle.setBackend`.
+"""
@@ -0,0 +1,89 @@
+"""
+JAX version of the finite :py:class:`Triangle` kernel.
+
+The internal force of a single triangle is written as a pure function of its deformed nodal
+positions.  The stress is linearized about the current state,
+
+.. math::
+
+    {\\bf S}({\\bf x}) = {\\bf S} + {\\bf C}_t : \\left( {\\bf E}({\\bf x}) - {\\bf E}({\\bf x}_0) \\right)
+
+so that the function reproduces the material's stress at the current configuration
+while its derivative, obtained by :code:`jax.jacfwd`, is the consistent tangent stiffness
+(material and geometric part).  The element function is mapped over all elements of a batch
+using :code:`jax.vmap` and compiled once using :code:`jax.jit`.
+
+Requires :code:`jax`.  Double precision is enabled on import.
+"""
+import numpy as np
+
+try:
+    import jax
+    import jax.numpy as jnp
+except ImportError as err:
+    raise ImportError("the jax backend requires jax: pip install femedu[jax]") from err
+
+jax.config.update("jax_enable_x64", True)
+
+
+def _strain(x, gcont):
+    """
+    :param x: nodal positions, shape (3,2)
+    :param gcont: dual base vectors (reference system), shape (2,2)
+    :returns: deformation gradient and Green-Lagrange strain tensor, both (2,2)
+    """
+    F = jnp.outer(x[1] - x[0], gcont[0]) + jnp.outer(x[2] - x[0], gcont[1])
+    return F, 0.5 * ( F.T @ F - jnp.eye(2) )
+
+
+def _forces(x, X, gcont, area, S, Ct):
+    """
+    Internal force of one triangle at positions **x**, linearized about state **X**.
+
+    :returns: nodal forces (3,2) and, as auxiliary data, the same forces and the 1st Piola-Kirchhoff stress
+    """
+    F, E  = _strain(x, gcont)
+    _, E0 = _strain(X, gcont)
+
+    dE = E - E0
+    ds = Ct @ jnp.array([dE[0,0], dE[1,1], dE[0,1] + dE[1,0]])
+    Sx = S + jnp.array([[ds[0], ds[2]], [ds[2], ds[1]]])
+
+    # 1st Piola-Kirchhoff stress
+    P = F @ Sx
+
+    # dual base vectors for all three nodes
+    GI = jnp.stack((-gcont[0] - gcont[1], gcont[0], gcont[1]))
+
+    forces = (GI @ P.T) * area
+    return forces, (forces, P)
+
+
+def _kernel(gcont, area, X, S, Ct):
+    """
+    Internal force and tangent stiffness of one triangle.
+    """
+    Kt, (forces, P) = jax.jacfwd(_forces, has_aux=True)(X, X, gcont, area, S, Ct)
+
+    # (a,i,b,j) -> (a,b,i,j)
+    return P, forces, jnp.transpose(Kt, (0, 2, 1, 3))
+
+
+_kernel_batch = jax.jit(jax.vmap(_kernel))
+
+
+def triangle_kernel(gcont, area, X, S, Ct):
+    """
+    Internal force and tangent stiffness for a stack of triangles.
+
+    Same interface as the default kernel of :py:mod:`femedu.elements.finite.Triangle`.
+
+    :param gcont: dual base vectors (reference system), shape (n,2,2)
+    :param area: element areas, shape (n,)
+    :param X: deformed nodal positions, shape (n,3,2)
+    :param S: 2nd Piola-Kirchhoff stress, shape (n,2,2)
+    :param Ct: tangent material stiffness, shape (n,3,3)
+    :returns: 1st Piola-Kirchhoff stress (n,2,2), nodal forces (n,3,2), and tangent stiffness (n,3,3,2,2)
+    """
+    P, Forces, Kt = _kernel_batch(gcont, area, X, S, Ct)
+    return np.asarray(P), np.asarray(Forces), np.asarray(Kt)
@@ -1,14 +1,23 @@
 import numpy as np
+import weakref
 from collections import deque
 
 from .Transformation import *
+from .NodeTable import *
 from ..recorder.Recorder import Recorder
 
+_DOF_BIT = { dof:1 << k for k, dof in enumerate(DOF_CODES) }
+
 class Node():
     """
     class: representing a single Node
+
+    Nodal data is stored in a shared :py:class:`NodeTable`.  The node itself only holds
+    a pointer to that table, :code:`self.table`, and its row index, :code:`self.i`.
+    The row is returned to the table once the node is garbage collected.
     """
     COUNT = 0
+    TABLE = NodeTable()
 
     def __init__(self, x0, y0=None, z0=None):
         """
@@ -19,31 +28,27 @@ class Node():
         self.ID = Node.COUNT
         Node.COUNT += 1
 
+        self.table = Node.TABLE
         if isinstance(z0, (int, float)):
-            self.pos = np.array([x0, y0, z0])
+            self.i = self.table.register(x0, y0, z0)
         elif isinstance(y0, (int, float)):
-            self.pos = np.array([x0, y0])
+            self.i = self.table.register(x0, y0)
         else:
-            self.pos = np.array([x0])
+            self.i = self.table.register(x0)
+
+        # hand the row back to the table when this node goes away
+        weakref.finalize(self, self.table.release, self.i).atexit = False
 
         self.is_lead     = True   # is this a lead node?  Will be set to follower (is_lead = False) if tied
         self.lead        = self   # following yourself
         self.followers   = []     # list of following nodes
 
-        self.disp          = None   # active current displacement vector
-        self.disp_n        = None   # previously converged displacement vector
         self.loadfactor_n  = 0.0    # load factor for previously converged state
-        self.disp_nn       = None   # two steps back converged displacement vector
         self.loadfactor_nn = 0.0    # load factor for two steps back converged state
-        self.disp_mode     = None   # stored displacement representing a mode shape
         self.disp_pushed   = deque()   # stored displacement vector (see pushU() and popU())
 
-        self.dofs        = {}
-        self.ndofs       = 0
         self.start       = None
         self.elements    = []
-        self._fixity     = []
-        self.loads       = {}
         self._hasLoad    = False
         self.transform   = None    # nodal transformation object
         self.dof_maps    = {}      # dof_idx maps for attached elements
@@ -52,12 +57,86 @@ class Node():
 
         self.setLoadFactor(1.0)
 
+    # ---- views into the node table ----
+
+    @property
+    def pos(self):
+        """initial position vector"""
+        return self.table.pos[self.i, :self.table.dim[self.i]]
+
+    @property
+    def ndofs(self):
+        """number of d.o.f.s at this node"""
+        return self.table.ndofs[self.i]
+
+    @property
+    def dof_codes(self):
+        """canonical codes (table columns) of this node's d.o.f.s in local order"""
+        return self.table.dof_codes[self.i, :self.table.ndofs[self.i]]
+
+    @property
+    def dofs(self):
+        """dictionary mapping dof-codes to local indices, in local order (read-only)"""
+        return { DOF_CODES[c]:k for k, c in enumerate(self.dof_codes) }
+
+    def hasDOF(self, dof):
+        """
+        :param dof: dof-code
+        :returns: **True** if **dof** has been requested at this node
+        """
+        return dof in DOF_INDEX and self.table.dof_local[self.lead.i, DOF_INDEX[dof]] >= 0
+
+    @property
+    def fixity_mask(self):
+        """fixed d.o.f.s of this node as a bitmask, bit k representing table column k"""
+        return int(self.table.fixity[self.i])
+
+    @fixity_mask.setter
+    def fixity_mask(self, mask):
+        self.table.fixity[self.i] = mask
+
+    @property
+    def disp(self):
+        """active current displacement vector"""
+        return self.table.disp[self.i, self.dof_codes]
+
+    @disp.setter
+    def disp(self, U):
+        self.table.disp[self.i, self.dof_codes] = U
+
+    @property
+    def disp_n(self):
+        """previously converged displacement vector"""
+        return self.table.disp_n[self.i, self.dof_codes]
+
+    @disp_n.setter
+    def disp_n(self, U):
+        self.table.disp_n[self.i, self.dof_codes] = U
+
+    @property
+    def disp_nn(self):
+        """two steps back converged displacement vector"""
+        return self.table.disp_nn[self.i, self.dof_codes]
+
+    @disp_nn.setter
+    def disp_nn(self, U):
+        self.table.disp_nn[self.i, self.dof_codes] = U
+
+    @property
+    def disp_mode(self):
+        """stored displacement representing a mode shape"""
+        return self.table.disp_mode[self.i, self.dof_codes]
+
+    @disp_mode.setter
+    def disp_mode(self, U):
+        self.table.disp_mode[self.i, self.dof_codes] = U
+
     def __str__(self):
         s  = "Node_{}:\n    x:    {}".format(self.ID, self.pos)
         if not self.is_lead:
             s +=  "\n    following {}".format(self.lead.getID())
-        if self._fixity:
-            s += f"\n    fix:  {self._fixity}"
+        if self.getFixedDofs():
+            s += f"\n    fix:  {self.getFixedDofs()}"
         load = self.getLoad()
         if isinstance(load, np.ndarray) and not np.isclose(np.linalg.norm(load), 0.0):
             s += f"\n    P:    {load}"
@@ -106,12 +185,7 @@ class Node():
         :param caller:  pointer to calling element (usually sent as self)
         """
         if self.is_lead:
-            dof_idx = []
-            for dof in dof_list:
-                if dof not in self.dofs:
-                    self.dofs[dof] = self.ndofs
-                    self.ndofs += 1
-                dof_idx.append(self.dofs[dof])
+            dof_idx = [ int(self.table.addDof(self.i, dof)) for dof in dof_list ]
 
             if caller not in self.elements:
                 self.elements.append(caller)
@@ -135,8 +209,10 @@ class Node():
         if self.is_lead:
             for dof in dofs:
                 if isinstance(dof, str):
-                    if dof not in self._fixity:
-                        self._fixity.append(dof)
+                    if dof not in _DOF_BIT:
+                        msg = f"unknown dof code '{dof}': must be one of {DOF_CODES}"
+                        raise TypeError(msg)
+                    self.fixity_mask |= _DOF_BIT[dof]
                 elif isinstance(dof,list) or isinstance(dof,tuple):
                     for item in dof:
                         self.fixDOF(item)
@@ -163,7 +239,7 @@ class Node():
         :param dof: dof code as defined in :code:`request()`
         """
         if self.is_lead:
-            return (dof in self._fixity)
+            return bool(self.fixity_mask & _DOF_BIT.get(dof, 0))
         else:
             return self.lead.isFixed(dof)
 
@@ -175,10 +251,7 @@ class Node():
         Indices are local to this node: :code:`0..num_dofs`
         """
         if self.is_lead:
-            idx = []
-            for i,dof in enumerate(self._fixity):
-                idx.append(i)
-            return np.array(idx, dtype=int)
+            return np.nonzero((self.fixity_mask >> self.dof_codes) & 1)[0]
         else:
             return self.lead.areFixed()
 
@@ -188,7 +261,8 @@ class Node():
         :returns: a list of fixed dofs by dof-code strings.
         """
         if self.is_lead:
-            return self._fixity[:]
+            mask = self.fixity_mask
+            return [ dof for dof in DOF_CODES if mask & _DOF_BIT[dof] ]
         else:
             return self.lead.getFixedDofs()
 
@@ -215,11 +289,11 @@ class Node():
 
             if dof_list:
                 for ui, dof in zip(U, dof_list):
-                    if dof in self.dofs:
+                    if self.hasDOF(dof):
                         if modeshape:
-                            self.disp_mode[self.dofs[dof]] = ui
+                            self.table.disp_mode[self.i, DOF_INDEX[dof]] = ui
                         else:
-                            self.disp[self.dofs[dof]] = ui
+                            self.table.disp[self.i, DOF_INDEX[dof]] = ui
                     else:
                         msg = f"requested dof:{dof} not present at current node.  Available dofs are {self.dofs.keys()}"
                         raise TypeError(msg)
@@ -239,7 +313,7 @@ class Node():
         :param dU: displacement correction from last iteration step.
         """
         if self.is_lead:
-            self.disp += dU
+            self.table.disp[self.i, self.dof_codes] += dU
 
         """
         Do not forward that call to the lead node or that increment will be duplicated.
@@ -285,15 +359,9 @@ class Node():
         """
         if self.is_lead:
             if 'modeshape' in kwargs and kwargs['modeshape']:
-                if not isinstance(self.disp_mode, np.ndarray):
-                    self.disp_mode = np.zeros(self.ndofs)
-                U = self.disp_mode
+                U = self.table.disp_mode[self.i]
             else:
-                if not isinstance(self.disp, np.ndarray):
-                    self.disp    = np.zeros(self.ndofs)
-                    self.disp_n  = np.zeros(self.ndofs)
-                    self.disp_nn = np.zeros(self.ndofs)
-                U = self.disp
+                U = self.table.disp[self.i]
 
             if caller:
                 # we know the calling element.
@@ -303,9 +371,8 @@ class Node():
                     msg = "caller not registered with this node"
                     raise TypeError(msg)
 
-                idx = self.dof_maps[caller]
-                ans = U[idx]
-                return np.array(ans)
+                idx = self.dof_codes[self.dof_maps[caller]]
+                return U[idx]
 
             else:
                 # we do not know who is requesting displacements, so provide all requested or ALL if no dofs were specified.
@@ -314,14 +381,13 @@ class Node():
                         dofs = [dofs]
                     ans = []
                     for dof in dofs:
-                        if dof in self.dofs:
-                            ans.append(U[self.dofs[dof]])
+                        if self.hasDOF(dof):
+                            ans.append(U[DOF_INDEX[dof]])
                         else:
                             ans.append(0.0)
+                    return np.array(ans)
                 else:
-                    ans = U
-
-                return np.array(ans)
+                    return U[self.dof_codes]
 
         else:
             return self.lead.getDisp(dofs=dofs, caller=caller, **kwargs)
@@ -332,10 +398,10 @@ class Node():
         """
         if self.is_lead:
             if previous_step:
-                dU = self.disp_n - self.disp_nn
+                dU = self.table.disp_n[self.i] - self.table.disp_nn[self.i]
             else:
-                dU = self.disp - self.disp_n
-            return dU
+                dU = self.table.disp[self.i] - self.table.disp_n[self.i]
+            return dU[self.dof_codes]
         else:
             return self.lead.getDeltaU(previous_step=previous_step)
 
@@ -345,7 +411,11 @@ class Node():
         :return: 0.0 if node is a "follower"
         """
         if self.is_lead:
-            dU = self.getDeltaU(previous_step)
+            # columns of d.o.f.s not present at this node are zero, so use the full row
+            if previous_step:
+                dU = self.table.disp_n[self.i] - self.table.disp_nn[self.i]
+            else:
+                dU = self.table.disp[self.i] - self.table.disp_n[self.i]
             return dU @ dU
         else:
             return 0.0
@@ -368,45 +438,11 @@ class Node():
         :param factor: deformation magnification factor, :math:`f`.
         :return: deformed position vector, :math:`{\\bf x}`.
         """
-        if self.is_lead:
-            if self.pos.shape[0] == 1:
-                my_dofs = ('ux',)
-            elif self.pos.shape[0] == 2:
-                my_dofs = ('ux','uy')
-            elif self.pos.shape[0] == 3:
-                my_dofs = ('ux','uy','uz')
-            else:  # don't know what that would be
-                msg = f"Don't know how to interprete position: {self.pos}"
-                raise TypeError(msg)
-
-            if 'modeshape' in kwargs and kwargs['modeshape']:
-                if not isinstance(self.disp_mode, np.ndarray):
-                    self.disp_mode = np.zeros(self.ndofs)
-
-                return self.pos + factor * self.getDisp(caller=None, dofs=my_dofs, modeshape=1)
-            else:
-                if not isinstance(self.disp, np.ndarray):
-                    self.disp    = np.zeros(self.ndofs)
-                    self.disp_n  = np.zeros(self.ndofs)
-                    self.disp_nn = np.zeros(self.ndofs)
-
-                return self.pos + factor * self.getDisp(caller=None, dofs=my_dofs)
-
+        dim = self.table.dim[self.i]
+        if 'modeshape' in kwargs and kwargs['modeshape']:
+            return self.pos + factor * self.table.disp_mode[self.table.lead[self.i], :dim]
         else:
-            if self.pos.shape[0] == 1:
-                my_dofs = ('ux',)
-            elif self.pos.shape[0] == 2:
-                my_dofs = ('ux','uy')
-            elif self.pos.shape[0] == 3:
-                my_dofs = ('ux','uy','uz')
-            else:  # don't know what that would be
-                msg = f"Don't know how to interprete position: {self.pos}"
-                raise TypeError(msg)
-
-            #return self.lead.getDeformedPos(caller=caller, factor=factor, **kwargs)
-            disp = self.lead.getDisp(dofs=my_dofs, caller=None, factor=factor, **kwargs)
-
-            return self.pos + factor * disp
+            return self.table.getDeformedPos(self.i, factor=factor)[:dim]
 
     def getIdx4Element(self, elem):
         """
@@ -428,12 +464,12 @@ class Node():
         if self.is_lead:
 
             if not dofs:
-                dofs = self.dofs.keys()
+                return self.start + np.arange(self.ndofs)
 
             idx = []
             for dof in dofs:
-                if dof in self.dofs:
-                    idx.append(self.dofs[dof])
+                if self.hasDOF(dof):
+                    idx.append(self.table.dof_local[self.i, DOF_INDEX[dof]])
                 else:
                     msg = f"dof {dof} not present at node {self.ID}"
                     raise TypeError(msg)
@@ -470,12 +506,8 @@ class Node():
         :type dofs: list of dof-codes
         """
         if self.is_lead:
-            # Check tuple type and if the dof exists (warn and continue)
-            for (load, dof) in zip(loads, dofs):
-                if dof in self.loads:
-                    self.loads[dof] += load
-                else:
-                    self.loads[dof] = load
+            cols = [ DOF_INDEX[dof] for dof in dofs ]
+            np.add.at(self.table.loads[self.i], cols, loads)
             self._hasLoad = True
         else:
             self.lead.addLoad(loads, dofs)
@@ -487,9 +519,8 @@ class Node():
         :param dofs:  associated list of DOFs to which respective loads are to be applied
         """
         if self.is_lead:
-            # Check tuple type and if the dof exists (warn and continue)
-            for (load, dof) in zip(loads, dofs):
-                self.loads[dof] = load
+            cols = [ DOF_INDEX[dof] for dof in dofs ]
+            self.table.loads[self.i, cols] = loads
             self._hasLoad = True
         else:
             self.lead.setLoad(loads, dofs)
@@ -499,7 +530,7 @@ class Node():
 
         """
         if self.is_lead:
-            self.loads = {}
+            self.table.loads[self.i].fill(0.0)
             self._hasLoad = False
         else:
             self.lead.resetLoad()
@@ -509,13 +540,9 @@ class Node():
         :returns: nodal load vector (ndarray)
         """
         if self.is_lead:
-            force = np.zeros(self.ndofs)
-            for dof in self.loads:
-                if dof in self.dofs:
-                    if apply_load_factor:
-                        force[self.dofs[dof]] = self.loads[dof] * self.loadfactor
-                    else:
-                        force[self.dofs[dof]] = self.loads[dof]
+            force = self.table.loads[self.i, self.dof_codes]
+            if apply_load_factor:
+                force *= self.loadfactor
         else:
             force = self.lead.getLoad(dof_list=dof_list, apply_load_factor=apply_load_factor)
 
@@ -535,9 +562,9 @@ class Node():
 
         """
         if self.is_lead:
-            self.disp_nn = np.zeros(len(self.dofs))
-            self.disp_n  = np.zeros(len(self.dofs))
-            self.disp    = np.zeros(len(self.dofs))
+            self.table.disp_nn[self.i].fill(0.0)
+            self.table.disp_n[self.i].fill(0.0)
+            self.table.disp[self.i].fill(0.0)
         else:
             self.lead.resetDisp()
 
@@ -603,9 +630,9 @@ class Node():
         This method is called every time a solver signals a converged solution.
         """
         if self.is_lead:
-            # rotate states (n)->(n-1) and current->(n)
-            self.disp_nn = self.disp_n.copy()
-            self.disp_n  = self.disp.copy()
+            # rotate states (n)->(n-1) and current->(n), in place
+            self.table.disp_nn[self.i] = self.table.disp_n[self.i]
+            self.table.disp_n[self.i]  = self.table.disp[self.i]
             self.loadfactor_nn = self.loadfactor_n
             self.loadfactor_n  = self.loadfactor
 
@@ -636,20 +663,23 @@ class Node():
         # transfer element maps
         for elem in self.dof_maps:
             elem_dof_map = []
-            for dof in self.dofs:
-                idx = self.dofs[dof]
-                if idx in self.dof_maps[elem]:
-                    elem_dof_map.append(dof)
+            for k in self.dof_maps[elem]:
+                elem_dof_map.append(DOF_CODES[self.dof_codes[k]])
             lead.request(elem_dof_map, elem)
 
         # transfer nodal loads
         if self._hasLoad:
-            self.lead.addLoad(self.loads.values(), self.loads.keys())
-            self.loads = {}
+            loads = self.table.loads[self.i]
+            codes = np.nonzero(loads)[0]
+            self.lead.addLoad(loads[codes], [ DOF_CODES[k] for k in codes ])
+            self.table.loads[self.i] = 0.0
             self._hasLoad = False
 
         # transfer fixities
-        self.lead.fixDOF(self._fixity)
+        self.lead.fixDOF(self.getFixedDofs())
+
+        # let the table know whom to follow
+        self.table.setLead(self.i, lead.i)
 
     def addFollower(self, follower):
         if follower in self.followers:
@@ -670,6 +700,8 @@ class Node():
         This should be used by a solution algorithm but not by regular
         user input.
         """
-        self.disp       = 2.0 * self.disp_n - self.disp_nn
+        U = self.table.disp[self.i]
+        np.multiply(2.0, self.table.disp_n[self.i], out=U)
+        U -= self.table.disp_nn[self.i]
         self.loadfactor = 2.0 * self.loadfactor_n - self.loadfactor_nn
 
@@ -0,0 +1,227 @@
+import numpy as np
+import heapq
+
+DOF_CODES = ('ux', 'uy', 'uz', 'rx', 'ry', 'rz')
+DOF_INDEX = { dof:k for k, dof in enumerate(DOF_CODES) }
+MAX_DOFS  = len(DOF_CODES)
+
+
+class NodeTable():
+    """
+    class: contiguous (structure-of-arrays) storage for nodal data
+
+    Every :py:class:`Node` owns one row in a :py:class:`NodeTable`.
+    Nodal positions are stored as rows of :code:`pos`.  Displacements and loads are stored
+    in columns identified by the canonical d.o.f. code,
+
+    .. list-table::
+        :header-rows: 1
+
+        * - column
+          - 0
+          - 1
+          - 2
+          - 3
+          - 4
+          - 5
+        * - code
+          - **ux**
+          - **uy**
+          - **uz**
+          - **rx**
+          - **ry**
+          - **rz**
+
+    independent of the order in which elements requested those d.o.f.s.
+    Columns of d.o.f.s not present at a node remain zero.
+    Fixities are stored as one bitmask per node with bit k representing column k.
+
+    The local (per node) d.o.f. order is kept in :code:`dof_codes`, i.e.,
+    :code:`dof_codes[i,k]` is the canonical column of the k-th d.o.f. of node i.
+    Its inverse, :code:`dof_local[i,c]`, holds the local index of column c at node i,
+    or -1 if that d.o.f. is not present.
+
+    Elements may thus gather the deformed geometry of all their nodes in one shot, e.g.,
+
+    .. code::
+
+        X = table.getDeformedPos(node_idx)
+
+    Rows of nodes that no longer exist are handed back through :py:meth:`release`
+    and reused by the next :py:meth:`register`.
+    """
+
+    def __init__(self, capacity=64):
+        """
+
+        :param capacity: initial number of rows to allocate.  The table grows as needed.
+        """
+        self.size     = 0
+        self.capacity = 0
+
+        self.pos       = np.zeros((0, 3))
+        self.dim       = np.zeros(0, dtype=int)
+
+        self.disp      = np.zeros((0, MAX_DOFS))   # active current displacement vector
+        self.disp_n    = np.zeros((0, MAX_DOFS))   # previously converged displacement vector
+        self.disp_nn   = np.zeros((0, MAX_DOFS))   # two steps back converged displacement vector
+        self.disp_mode = np.zeros((0, MAX_DOFS))   # stored displacement representing a mode shape
+
+        self.loads     = np.zeros((0, MAX_DOFS))
+        self.fixity    = np.zeros(0, dtype=np.uint8)         # bit k set if column k is fixed
+
+        self.dof_codes = np.zeros((0, MAX_DOFS), dtype=int)   # canonical code of each local dof
+        self.dof_local = np.zeros((0, MAX_DOFS), dtype=int)   # local index of each canonical code
+        self.ndofs     = np.zeros(0, dtype=int)               # number of dofs per node
+        self.lead      = np.zeros(0, dtype=int)               # row of the lead node (self if not tied)
+        self.alive     = np.zeros(0, dtype=bool)              # row is in use by a node
+
+        self._free     = []                                   # released rows (heap, lowest first)
+
+        self._grow(capacity)
+
+    def __len__(self):
+        return self.size - len(self._free)
+
+    def __repr__(self):
+        return "NodeTable(size={})".format(self.size)
+
+    def _grow(self, capacity):
+        """
+        Reallocate all arrays to hold at least **capacity** rows.
+
+        .. note::
+
+            Rows are always addressed through the table, never through views held elsewhere,
+            since any growth replaces the underlying arrays.
+        """
+        if capacity <= self.capacity:
+            return
+
+        n = self.size
+
+        def resized(old, fill=0):
+            new = np.full((capacity,) + old.shape[1:], fill, dtype=old.dtype)
+            new[:n] = old[:n]
+            return new
+
+        self.pos       = resized(self.pos)
+        self.dim       = resized(self.dim)
+        self.disp      = resized(self.disp)
+        self.disp_n    = resized(self.disp_n)
+        self.disp_nn   = resized(self.disp_nn)
+        self.disp_mode = resized(self.disp_mode)
+        self.loads     = resized(self.loads)
+        self.fixity    = resized(self.fixity)
+        self.dof_codes = resized(self.dof_codes, fill=-1)
+        self.dof_local = resized(self.dof_local, fill=-1)
+        self.ndofs     = resized(self.ndofs)
+        self.lead      = resized(self.lead)
+        self.alive     = resized(self.alive)
+
+        self.capacity = capacity
+
+    def register(self, x, y=None, z=None):
+        """
+        Add a new row for a node at position (x, y, z).
+
+        :param x: x-coordinate
+        :param y: y-coordinate (**None** for 1D nodes)
+        :param z: z-coordinate (**None** for 1D and 2D nodes)
+        :returns: index of the new row (``int``)
+        """
+        if self._free:
+            i = heapq.heappop(self._free)
+        else:
+            if self.size >= self.capacity:
+                self._grow(2 * self.capacity)
+
+            i = self.size
+            self.size += 1
+
+        if z is not None:
+            self.pos[i] = (x, y, z)
+            self.dim[i] = 3
+        elif y is not None:
+            self.pos[i,:2] = (x, y)
+            self.dim[i] = 2
+        else:
+            self.pos[i,0] = x
+            self.dim[i] = 1
+
+        self.lead[i]  = i
+        self.alive[i] = True
+
+        return i
+
+    def release(self, i):
+        """
+        Clear row **i** and mark it for reuse.  Called once the owning node is garbage collected.
+
+        :param i: row index of the node
+        """
+        self.pos[i]       = 0.0
+        self.dim[i]       = 0
+        self.disp[i]      = 0.0
+        self.disp_n[i]    = 0.0
+        self.disp_nn[i]   = 0.0
+        self.disp_mode[i] = 0.0
+        self.loads[i]     = 0.0
+        self.fixity[i]    = 0
+        self.dof_codes[i] = -1
+        self.dof_local[i] = -1
+        self.ndofs[i]     = 0
+        self.lead[i]      = i
+        self.alive[i]     = False
+
+        heapq.heappush(self._free, i)
+
+    def addDof(self, i, dof):
+        """
+        Append d.o.f. **dof** to the local d.o.f. list of node **i** unless already present
+
+        :param i: row index of the node
+        :param dof: dof-code (``str``)
+        :returns: local index of the d.o.f.
+        """
+        if dof not in DOF_INDEX:
+            msg = f"unknown dof code '{dof}': must be one of {DOF_CODES}"
+            raise TypeError(msg)
+
+        c = DOF_INDEX[dof]
+        if self.dof_local[i,c] >= 0:
+            return self.dof_local[i,c]
+
+        k = self.ndofs[i]
+        self.dof_codes[i,k] = c
+        self.dof_local[i,c] = k
+        self.ndofs[i] += 1
+
+        return k
+
+    def setLead(self, i, lead):
+        """
+        Let row **i** (and everything already following **i**) follow row **lead**.
+        """
+        root = self.lead[lead]
+        n = self.size
+        self.lead[:n][self.alive[:n] & (self.lead[:n] == i)] = root
+        self.lead[i] = root
+
+    def getPos(self, idx):
+        """
+        :param idx: row index or index array
+        :returns: reference positions, padded to three components
+        """
+        return self.pos[idx]
+
+    def getDeformedPos(self, idx, factor=1.0):
+        """
+        Return deformed positions :math:`{\\bf x} = {\\bf X} + f \\: {\\bf u}`
+        for all rows in **idx** using a single gather.
+
+        :param idx: row index or index array, e.g., the node indices of an element
+        :param factor: deformation magnification factor, :math:`f`.
+        :returns: deformed positions, padded to three components
+        """
+        return self.pos[idx] + factor * self.disp[self.lead[idx], :3]
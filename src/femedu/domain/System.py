@@ -28,6 +28,9 @@ class System():
         self.constraints = []
         self.plotter     = Plotter()
 
+        self._finalized  = False
+        self._batches    = {}     # element type -> batch data (see finalize())
+
         self.disp        = np.array([])
         self.loads       = np.zeros_like(self.disp)
 
@@ -98,6 +101,8 @@ class System():
             elem.setLoadFactor(self.loadfactor)
             self.elements.append(elem)
 
+        self._finalized = False
+
     def addConstraint(self, *newConstraints):
         """
 
@@ -323,6 +328,50 @@ class System():
             msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
             raise NotImplementedError(msg)
 
+    def finalize(self):
+        """
+        Group elements by type and let every element type collect its batch data
+        (see :py:meth:`Element.make_batch`).
+
+        This is done automatically before the first state update after elements were added.
+        """
+        groups = {}
+        for elem in self.elements:
+            groups.setdefault(type(elem), []).append(elem)
+
+        self._batches = { element_type:element_type.make_batch(elements)
+                          for element_type, elements in groups.items() }
+        self._finalized = True
+
+    def build_fixed_mask(self, ndof):
+        """
+        Collect all fixed d.o.f.s of the system.
+
+        Requires the global d.o.f. numbering (:code:`node.start`) set by the solver.
+
+        :param ndof: number of system d.o.f.s
+        :returns: boolean array of length **ndof**, **True** for every fixed d.o.f.
+        """
+        fixed = np.zeros(ndof, dtype=bool)
+        for node in self.nodes:
+            if node.isLead() and node.fixity_mask:
+                fixed[node.start + node.areFixed()] = True
+        return fixed
+
+    def updateState(self):
+        """
+        Update the state of all elements for the current nodal displacements.
+
+        Every batch created by :py:meth:`finalize` is handed to the
+        :py:meth:`Element.updateState_batch` method of its type, allowing for vectorized
+        state updates of all elements of one type.
+        """
+        if not self._finalized:
+            self.finalize()
+
+        for element_type, batch in self._batches.items():
+            element_type.updateState_batch(batch)
+
     def checkStability(self, **kwdargs):
         """
         Computes the stability index as
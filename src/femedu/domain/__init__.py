@@ -1,9 +1,11 @@
 __all__ = (
     'Node',
+    'NodeTable',
     'Transformation',
     'System'
 )
 \
 from .System import System
 from .Node import Node
+from .NodeTable import NodeTable
 from .Transformation import Transformation
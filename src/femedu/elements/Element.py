@@ -39,6 +39,8 @@ class Element(DrawElement):
         self.Forces   = []
         self.Kt       = []
 
+        self._gdofs   = None   # cached global d.o.f. indices (see getGlobalDofs())
+
         self.setRecorder(None)
 
         self.setLoadFactor(1.0)
@@ -261,8 +263,8 @@ class Element(DrawElement):
         self.computeSurfaceLoads()
 
         if isinstance(self.Loads, np.ndarray):
-            Loads = [ np.array(x) for x in self.Loads ]
-            return Loads
+            # one row per node
+            return self.Loads
         elif self.Loads:
             return self.Loads
         else:
@@ -296,6 +298,54 @@ class Element(DrawElement):
         self.updateState()
         return self.Kt
 
+    def getGlobalDofs(self, per_node=False):
+        """
+        Global d.o.f. indices of this element, node by node, in the order requested by the element.
+
+        Indices are computed once and cached.  Solvers call :py:meth:`resetGlobalDofs`
+        whenever the global d.o.f. numbering changes.
+
+        :param per_node: set to **True** to receive a list with one index array per node
+        :return: index array matching the rows of :py:meth:`getKtMatrix`
+        """
+        if self._gdofs is None:
+            idx  = [ node.getIdx4Element(self) for node in self.nodes ]
+            flat = np.concatenate(idx)
+            self._gdofs = {'nodes':idx,
+                           'flat':flat,
+                           'rows':np.repeat(flat, flat.size),
+                           'cols':np.tile(flat, flat.size)}
+
+        if per_node:
+            return self._gdofs['nodes']
+        return self._gdofs['flat']
+
+    def getCOOIndices(self):
+        """
+        :return: row and column indices of all entries of :py:meth:`getKtMatrix` within the
+                 global system (flattened, cached)
+        """
+        self.getGlobalDofs()
+        return self._gdofs['rows'], self._gdofs['cols']
+
+    def resetGlobalDofs(self):
+        """
+        Drop cached global d.o.f. indices (see :py:meth:`getGlobalDofs`)
+        """
+        self._gdofs = None
+
+    def getKtMatrix(self):
+        """
+        Return the current tangent stiffness as a single square matrix,
+        with rows and columns ordered node by node.  Does not update the state.
+
+        :return: element tangent stiffness (ndarray)
+        """
+        if isinstance(self.Kt, np.ndarray) and self.Kt.ndim == 4:
+            n, m, p, q = self.Kt.shape
+            return self.Kt.transpose(0, 2, 1, 3).reshape(n*p, m*q)
+        return np.block([ [ np.atleast_2d(KIJ) for KIJ in row ] for row in self.Kt ])
+
     def updateState(self):
         """
 
@@ -303,6 +353,33 @@ class Element(DrawElement):
         msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
         raise NotImplementedError(msg)
 
+    @classmethod
+    def make_batch(cls, elements):
+        """
+        Collect whatever data :py:meth:`updateState_batch` needs for all **elements** of this type.
+        Called once by :py:meth:`System.finalize`.
+
+        The default implementation returns the list of elements.
+        Element types with a vectorized implementation may overload this method.
+
+        :param elements: list of elements of this type
+        :returns: batch object to be passed to :py:meth:`updateState_batch`
+        """
+        return list(elements)
+
+    @classmethod
+    def updateState_batch(cls, batch):
+        """
+        Update the state of all elements in **batch**.
+
+        The default implementation calls :py:meth:`updateState` for every element.
+        Element types with a vectorized implementation may overload this method.
+
+        :param batch: as returned by :py:meth:`make_batch`
+        """
+        for element in batch:
+            element.updateState()
+
     def _requestDofs(self, dof_requests):
         """
         Helper function (internal use) to inform **all** nodes of this element about the needed/used
@@ -2,11 +2,175 @@ import numpy as np
 from ..Element import *
 from ...domain.Node import *
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+_I2 = np.eye(2)
+
+
+def _triangle_strain(gcont, X):
+    """
+    Green-Lagrange strain for a stack of triangles.
+
+    :param gcont: dual base vectors (reference system), shape (n,2,2)
+    :param X: deformed nodal positions, shape (n,3,2)
+    :returns: strain components (xx, yy, xy), shape (n,3)
+    """
+    gs = X[:,1] - X[:,0]
+    gt = X[:,2] - X[:,0]
+
+    # deformation gradient
+    F = np.einsum('ei,eJ->eiJ', gs, gcont[:,0]) + np.einsum('ei,eJ->eiJ', gt, gcont[:,1])
+
+    eps = 0.5 * ( np.einsum('eki,ekj->eij', F, F) - _I2 )
+
+    return np.stack((eps[:,0,0], eps[:,1,1], eps[:,0,1] + eps[:,1,0]), axis=1)
+
+
+def _triangle_kernel_numpy(gcont, area, X, S, Ct):
+    """
+    Internal force and tangent stiffness for a stack of triangles (NumPy version).
+
+    :param gcont: dual base vectors (reference system), shape (n,2,2)
+    :param area: element areas, shape (n,)
+    :param X: deformed nodal positions, shape (n,3,2)
+    :param S: 2nd Piola-Kirchhoff stress, shape (n,2,2)
+    :param Ct: tangent material stiffness, shape (n,3,3)
+    :returns: 1st Piola-Kirchhoff stress (n,2,2), nodal forces (n,3,2), and tangent stiffness (n,3,3,2,2)
+    """
+    Gs = gcont[:,0]
+    Gt = gcont[:,1]
+    Gu = -Gs - Gt
+
+    # covariant base vectors (current system)
+    gs = X[:,1] - X[:,0]
+    gt = X[:,2] - X[:,0]
+
+    # deformation gradient
+    F = np.einsum('ei,eJ->eiJ', gs, Gs) + np.einsum('ei,eJ->eiJ', gt, Gt)
+
+    # 1st Piola-Kirchhoff stress
+    P = np.einsum('eij,ejk->eik', F, S)
+
+    # dual base vectors for all three nodes
+    GI = np.stack((Gu, Gs, Gt), axis=1)
+
+    # internal force: tractions times area
+    Forces = np.einsum('eij,eaj->eai', P, GI) * area[:, np.newaxis, np.newaxis]
+
+    # compute the kinematic matrices
+    gx = Gs[:,0,np.newaxis] * gs + Gt[:,0,np.newaxis] * gt
+    gy = Gs[:,1,np.newaxis] * gs + Gt[:,1,np.newaxis] * gt
+
+    B = np.empty((X.shape[0], 3, 3, 2))
+    B[:,:,0] = GI[:,:,0,np.newaxis] * gx[:,np.newaxis]
+    B[:,:,1] = GI[:,:,1,np.newaxis] * gy[:,np.newaxis]
+    B[:,:,2] = GI[:,:,1,np.newaxis] * gx[:,np.newaxis] + GI[:,:,0,np.newaxis] * gy[:,np.newaxis]
+
+    # tangent stiffness: material and geometric part
+    DB  = np.einsum('ekl,eblj->ebkj', Ct * area[:, np.newaxis, np.newaxis], B)
+    Kt  = np.einsum('eaki,ebkj->eabij', B, DB)
+    GIJ = np.einsum('eai,eij,ebj->eab', GI, S, GI) * area[:, np.newaxis, np.newaxis]
+    Kt[..., 0, 0] += GIJ
+    Kt[..., 1, 1] += GIJ
+
+    return P, Forces, Kt
+
+
+def _triangle_kernel_loops(gcont, area, X, S, Ct):
+    """
+    Internal force and tangent stiffness for a stack of triangles (loop version).
+
+    Same interface as :py:func:`_triangle_kernel_numpy`.  This version is meant to be
+    compiled by numba and runs in parallel over the element axis.
+    """
+    nelem = X.shape[0]
+
+    P      = np.empty((nelem, 2, 2))
+    Forces = np.empty((nelem, 3, 2))
+    Kt     = np.empty((nelem, 3, 3, 2, 2))
+
+    for e in prange(nelem):
+
+        GI = np.empty((3, 2))
+        GI[1] = gcont[e,0]
+        GI[2] = gcont[e,1]
+        GI[0] = -GI[1] - GI[2]
+
+        # covariant base vectors (current system)
+        gs = X[e,1] - X[e,0]
+        gt = X[e,2] - X[e,0]
+
+        # deformation gradient
+        F = np.empty((2, 2))
+        for i in range(2):
+            for J in range(2):
+                F[i,J] = gs[i] * GI[1,J] + gt[i] * GI[2,J]
+
+        # 1st Piola-Kirchhoff stress
+        for i in range(2):
+            for k in range(2):
+                P[e,i,k] = F[i,0] * S[e,0,k] + F[i,1] * S[e,1,k]
+
+        # internal force: tractions times area
+        for a in range(3):
+            for i in range(2):
+                Forces[e,a,i] = (P[e,i,0] * GI[a,0] + P[e,i,1] * GI[a,1]) * area[e]
+
+        # compute the kinematic matrices
+        gx = GI[1,0] * gs + GI[2,0] * gt
+        gy = GI[1,1] * gs + GI[2,1] * gt
+
+        B = np.empty((3, 3, 2))
+        for a in range(3):
+            for i in range(2):
+                B[a,0,i] = GI[a,0] * gx[i]
+                B[a,1,i] = GI[a,1] * gy[i]
+                B[a,2,i] = GI[a,1] * gx[i] + GI[a,0] * gy[i]
+
+        # material stiffness times kinematic matrices, D B, scaled by the area
+        DB = np.empty((3, 3, 2))
+        for b in range(3):
+            for j in range(2):
+                B0 = B[b,0,j]
+                B1 = B[b,1,j]
+                B2 = B[b,2,j]
+                DB[b,0,j] = (Ct[e,0,0] * B0 + Ct[e,0,1] * B1 + Ct[e,0,2] * B2) * area[e]
+                DB[b,1,j] = (Ct[e,1,0] * B0 + Ct[e,1,1] * B1 + Ct[e,1,2] * B2) * area[e]
+                DB[b,2,j] = (Ct[e,2,0] * B0 + Ct[e,2,1] * B1 + Ct[e,2,2] * B2) * area[e]
+
+        # tangent stiffness: material and geometric part
+        for a in range(3):
+            Ta0 = GI[a,0] * S[e,0,0] + GI[a,1] * S[e,1,0]
+            Ta1 = GI[a,0] * S[e,0,1] + GI[a,1] * S[e,1,1]
+            for b in range(3):
+                Gab = (Ta0 * GI[b,0] + Ta1 * GI[b,1]) * area[e]
+                Kt[e,a,b,0,0] = B[a,0,0] * DB[b,0,0] + B[a,1,0] * DB[b,1,0] + B[a,2,0] * DB[b,2,0] + Gab
+                Kt[e,a,b,0,1] = B[a,0,0] * DB[b,0,1] + B[a,1,0] * DB[b,1,1] + B[a,2,0] * DB[b,2,1]
+                Kt[e,a,b,1,0] = B[a,0,1] * DB[b,0,0] + B[a,1,1] * DB[b,1,0] + B[a,2,1] * DB[b,2,0]
+                Kt[e,a,b,1,1] = B[a,0,1] * DB[b,0,1] + B[a,1,1] * DB[b,1,1] + B[a,2,1] * DB[b,2,1] + Gab
+
+    return P, Forces, Kt
+
+
+if numba:
+    prange = numba.prange
+    _triangle_kernel = numba.njit(parallel=True, fastmath=True, cache=True)(_triangle_kernel_loops)
+else:
+    prange = range
+    _triangle_kernel = _triangle_kernel_numpy
+
+
 class Triangle(Element):
     """
     class: representing a single truss element
     """
 
+    # kernel used by updateState() and updateState_batch() (see setBackend())
+    _batch_kernel = staticmethod(_triangle_kernel)
+
     def __init__(self, node0, node1, node2, material, label=None):
         super().__init__((node0, node1, node2), material, label=label)
         self.element_type = DrawElement.TRIANGLE
@@ -23,10 +187,19 @@ class Triangle(Element):
 
         self._requestDofs(dof_list)
 
+        # rows of the nodes in the node table (for one-shot gathers)
+        self.node_table = node0.table
+        self.node_idx   = np.array([ node.i for node in self.nodes ], dtype=int)
+        self.ndim       = ndof
+
         self.distributed_load = [0.0, 0.0, 0.0]
         self.force    = 0.0
-        self.Forces   = [ np.zeros(ndof) for k in range(len(self.nodes)) ]
-        self.Kt       = [ [ np.zeros(ndof) for k in range(len(self.nodes)) ] for m in range(len(self.nodes)) ]
+        self.Forces   = np.zeros((3, ndof))             # filled in place by updateState()
+        self.Kt       = np.zeros((3, 3, ndof, ndof))    # filled in place by updateState()
+        self.Loads    = np.zeros((3, ndof))             # filled in place by computeSurfaceLoads()
+
+        # scratch buffer for the 2nd Piola-Kirchhoff stress (leading axis for the kernel)
+        self.S_buf    = np.empty((1, 2, 2))
 
         # covariant base vectors (reference system)
         base1 = node1.getPos() - node0.getPos()
@@ -36,10 +209,12 @@ class Triangle(Element):
         # metric (reference system)
         self.GIJ = self.gcov @ self.gcov.T
 
-        # dual base vectors (reference system)
-        self.gcont = np.linalg.inv(self.GIJ) @ self.gcov
+        # dual base vectors (reference system) using the closed-form inverse of the 2x2 metric
+        (a, b), (c, d) = self.GIJ
+        det = a*d - b*c
+        self.gcont = np.array([[d, -b], [-c, a]]) / det @ self.gcov
 
-        self.area = np.sqrt(np.linalg.det(self.GIJ)) / 2.0
+        self.area = np.sqrt(det) / 2.0
 
     def __str__(self):
         s = super(Triangle, self).__str__()
@@ -79,94 +254,126 @@ class Triangle(Element):
 
     def updateState(self):
 
-        node0 = self.nodes[0]
-        node1 = self.nodes[1]
-        node2 = self.nodes[2]
+        # deformed nodal positions
+        X = self.node_table.getDeformedPos(self.node_idx[np.newaxis])[..., :self.ndim]
+        gcont = self.gcont[np.newaxis]
 
-        Gs = self.gcont[0]
-        Gt = self.gcont[1]
-        Gu = -Gs - Gt
+        # update the material state
+        eps = _triangle_strain(gcont, X)[0]
+        strain = {'xx':eps[0], 'yy':eps[1], 'xy':eps[2]}
+        self.material.setStrain(strain)
 
-        # covariant base vectors (current system)
+        # 2nd Piola-Kirchhoff stress
+        self.material.getStressMatrix(self.S_buf[0])
 
-        gs = node1.getDeformedPos() - node0.getDeformedPos()
-        gt = node2.getDeformedPos() - node0.getDeformedPos()
-        gu = -gs - gt
+        # tangent material stiffness
+        Ct = self.material.getStiffness()[np.newaxis]
 
-        # metric (current system)
-        gcov = np.vstack((gs, gt))
-        gIJ = gcov @ gcov.T
+        P, Forces, Kt = self._batch_kernel(gcont, np.array([self.area]), X, self.S_buf, Ct)
 
-        # deformation gradient
-        F = np.outer(gs, Gs) + np.outer(gt, Gt)
+        # store stress for reporting
+        self.stress = {'xx':P[0,0,0], 'xy':P[0,0,1], 'yx':P[0,1,0], 'yy':P[0,1,1]}
 
-        convective_strain = 0.5 * (gIJ - self.GIJ)
-        almansi_strain = 0.5 * ( np.tensordot(F,F,((0,), (0,))) - np.eye(np.size(gs)) )
+        self.Forces[...] = Forces[0]
+        self.Kt[...]     = Kt[0]
 
-        # Dphi0_inv = np.linalg.inv(self.gcov.T)
-        # val = Dphi0_inv.T @ convective_strain @ Dphi0_inv  # same as almansi_strain
+        # .. applied element load (reference load)
+        self.computeSurfaceLoads()
 
-        eps = almansi_strain
+    @classmethod
+    def setBackend(cls, backend=None):
+        """
+        Select the kernel used by :py:meth:`updateState` and :py:meth:`updateState_batch` for all triangles.
 
-        # update the material state
+        .. list-table::
+            :header-rows: 1
 
-        strain = {'xx':eps[0,0], 'yy':eps[1,1], 'xy':eps[0,1]+eps[1,0]}
+            * - backend
+              - kernel
+            * - **None**
+              - compiled by :code:`numba` if available, vectorized :code:`numpy` otherwise (default)
+            * - **'numpy'**
+              - vectorized :code:`numpy`
+            * - **'jax'**
+              - :py:mod:`femedu.backends.jax_triangle`, tangent by automatic differentiation (requires :code:`jax`)
 
-        self.material.setStrain(strain)
+        :param backend: name of the backend
+        """
+        if backend is None:
+            kernel = _triangle_kernel
+        elif backend == 'numpy':
+            kernel = _triangle_kernel_numpy
+        elif backend == 'jax':
+            from ...backends.jax_triangle import triangle_kernel as kernel
+        else:
+            msg = f"unknown backend '{backend}': must be one of None, 'numpy', 'jax'"
+            raise TypeError(msg)
 
-        # 2nd Piola-Kirchhoff stress
-        stress = self.material.getStress()
+        cls._batch_kernel = staticmethod(kernel)
 
-        S = np.array( [[stress['xx'],stress['xy']],[stress['xy'],stress['yy']]] )
+    @classmethod
+    def make_batch(cls, elements):
+        """
+        Collect structure-of-arrays data for :py:meth:`updateState_batch`.
 
-        # 1st Piola-Kirchhoff stress
-        P = F @ S
+        Triangles are grouped by material type.  Elements whose material does not provide a
+        :code:`getStress_batch()` method, or elements not using 2D nodes,
+        are kept aside and will be updated one at a time.
 
-        # store stress for reporting
-        self.stress = {'xx':P[0,0], 'xy':P[0,1], 'yx':P[1,0], 'yy':P[1,1]}
+        :param elements: list of :py:class:`Triangle` elements
+        :returns: tuple of (list of :py:class:`TriangleBatch`, list of remaining elements)
+        """
+        groups = {}
+        others = []
+        for elem in elements:
+            if elem.ndim == 2 and hasattr(elem.material, 'getStress_batch'):
+                groups.setdefault(type(elem.material), []).append(elem)
+            else:
+                others.append(elem)
+
+        return [ TriangleBatch(group) for group in groups.values() ], others
+
+    @classmethod
+    def updateState_batch(cls, batch):
+        """
+        Vectorized version of :py:meth:`updateState` for a list of triangles.
 
-        # tractions
-        ts = P @ Gs
-        tt = P @ Gt
-        tu = P @ Gu
+        Kinematics, internal forces, and tangent stiffness are evaluated for all
+        elements of a :py:class:`TriangleBatch` in one call to the triangle kernel.
 
-        # initialize arrays
-        gx = Gs[0] * gs + Gt[0] * gt
-        gy = Gs[1] * gs + Gt[1] * gt
+        :param batch: as returned by :py:meth:`make_batch`
+        """
+        batches, others = batch
 
-        # compute the kinematic matrices
-        GI = (Gu, Gs, Gt)
+        for elem in others:
+            elem.updateState()
 
-        Bu = [Gu[0]*gx, Gu[1]*gy, Gu[1]*gx + Gu[0]*gy]
-        Bs = [Gs[0]*gx, Gs[1]*gy, Gs[1]*gx + Gs[0]*gy]
-        Bt = [Gt[0]*gx, Gt[1]*gy, Gt[1]*gx + Gt[0]*gy]
+        for data in batches:
 
-        BI = ( np.array(Bu), np.array(Bs), np.array(Bt) )
+            # deformed nodal positions
+            X = data.node_table.getDeformedPos(data.node_ids)[..., :2]
 
-        # internal force
-        self.Forces = [
-            tu * self.area,
-            ts * self.area,
-            tt * self.area
-            ]
+            # update the material state
+            strain = _triangle_strain(data.gcont, X)
 
-        # tangent stiffness
-        Ct = self.material.getStiffness() * self.area
+            stress, Ct = data.material_type.getStress_batch(data.materials, strain, elastic=data.elastic)
 
-        Kt = []
-        One = np.eye(2, dtype=np.float64)
-        for Gi, Bi in zip(GI, BI):
-            Krow = []
-            Ti = Gi @ S
-            for Gj, Bj in  zip(GI, BI):
-                GIJ = Ti @ Gj * self.area
-                Krow.append( Bi.T @ Ct @ Bj + GIJ * One)
-            Kt.append( Krow )
+            # 2nd Piola-Kirchhoff stress
+            S = data.S
+            S[:,0,0] = stress[:,0]
+            S[:,1,1] = stress[:,1]
+            S[:,0,1] = stress[:,2]
+            S[:,1,0] = stress[:,2]
 
-        self.Kt = Kt
+            P, Forces, Kt = cls._batch_kernel(data.gcont, data.area, X, S, Ct)
 
-        # .. applied element load (reference load)
-        self.computeSurfaceLoads()
+            for k, elem in enumerate(data.elements):
+                elem.stress = {'xx':P[k,0,0], 'xy':P[k,0,1], 'yx':P[k,1,0], 'yy':P[k,1,1]}
+                elem.Forces[...] = Forces[k]
+                elem.Kt[...]     = Kt[k]
+
+                # .. applied element load (reference load)
+                elem.computeSurfaceLoads()
 
     def computeSurfaceLoads(self):
         """
@@ -176,33 +383,53 @@ class Triangle(Element):
         element supporting surface loads
 
         """
-        self.Loads = [ np.zeros_like(self.Forces[I]) for I in range(len(self.nodes)) ]
+        self.Loads.fill(0.0)
 
         for I, face in enumerate(self.faces):
+            # skip unloaded faces
+            if not any(face.load):
+                continue
+
             loads = face.computeNodalForces()
 
-            # indexing
-            J = I+1
-            if J>2:
-                J -= 3
+            # face I runs from node I to node I+1
+            J = (I+1) % 3
 
             # add to element load vectors
             self.Loads[I] += loads[0]
             self.Loads[J] += loads[1]
-            if loads.shape[0]>2:
-                numNodes = len(self.nodes)
-                if numNodes == 6:
-                    K = I + 3
-                elif numNodes == 8 or numNodes == 9:
-                    K = I + 4
-                else:
-                    msg = "Force data provided from Face2D inconsistent with element data"
-                    raise TypeError(msg)
-
-                self.Loads[K] += loads[2]
 
     def getStress(self):
         return self.Stress
 
 
+class TriangleBatch():
+    """
+    class: structure-of-arrays data for a group of :py:class:`Triangle` elements sharing one material type
+
+    All arrays are indexed by the position of the element within :code:`elements`.
+    """
+
+    def __init__(self, elements):
+        """
+
+        :param elements: list of :py:class:`Triangle` elements with 2D nodes
+        """
+        self.elements      = elements
+        self.materials     = [ elem.material for elem in elements ]
+        self.material_type = type(self.materials[0])
+
+        self.node_table = elements[0].node_table
+        self.node_ids   = np.array([ elem.node_idx for elem in elements ])     # (nE,3)
+
+        self.gcont = np.array([ elem.gcont for elem in elements ])            # (nE,2,2)
+        self.area  = np.array([ elem.area for elem in elements ])
+
+        # elastic material data: (elastic stiffness, nu, thickness, fy)
+        self.elastic = self.material_type.getElasticity_batch(self.materials)
+
+        # scratch buffer for the 2nd Piola-Kirchhoff stress
+        self.S = np.empty((len(elements), 2, 2))
 
+    def __len__(self):
+        return len(self.elements)
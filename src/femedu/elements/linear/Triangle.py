@@ -23,10 +23,21 @@ class Triangle(Element):
 
         self._requestDofs(dof_list)
 
+        # rows of the nodes in the node table (for one-shot gathers)
+        self.node_table = node0.table
+        self.node_idx   = np.array([ node.i for node in self.nodes ], dtype=int)
+        self.ndim       = ndof
+
+        # identity and scratch buffers for the stress tensor and kinematic matrices
+        self._I2     = np.eye(ndof)
+        self.S_buf   = np.empty((2,2))
+        self._B      = np.empty((3,3,ndof))
+
         self.distributed_load = [0.0, 0.0, 0.0]
         self.force    = 0.0
-        self.Forces   = [ np.zeros(ndof) for k in range(len(self.nodes)) ]
-        self.Kt       = [ [ np.zeros(ndof) for k in range(len(self.nodes)) ] for m in range(len(self.nodes)) ]
+        self.Forces   = np.zeros((3, ndof))             # filled in place by updateState()
+        self.Kt       = np.zeros((3, 3, ndof, ndof))    # filled in place by updateState()
+        self.Loads    = np.zeros((3, ndof))             # filled in place by computeSurfaceLoads()
 
         # covariant base vectors (reference system)
         base1 = node1.getPos() - node0.getPos()
@@ -36,10 +47,12 @@ class Triangle(Element):
         # metric (reference system)
         self.GIJ = self.gcov @ self.gcov.T
 
-        # dual base vectors (reference system)
-        self.gcont = np.linalg.inv(self.GIJ) @ self.gcov
+        # dual base vectors (reference system) using the closed-form inverse of the 2x2 metric
+        (a, b), (c, d) = self.GIJ
+        det = a*d - b*c
+        self.gcont = np.array([[d, -b], [-c, a]]) / det @ self.gcov
 
-        self.area = np.sqrt(np.linalg.det(self.GIJ)) / 2.0
+        self.area = np.sqrt(det) / 2.0
 
     def __str__(self):
         s = super(Triangle, self).__str__()
@@ -79,29 +92,25 @@ class Triangle(Element):
 
     def updateState(self):
 
-        node0 = self.nodes[0]
-        node1 = self.nodes[1]
-        node2 = self.nodes[2]
-
         Gs = self.gcont[0]
         Gt = self.gcont[1]
         Gu = -Gs - Gt
 
+        # dual base vectors for all three nodes
+        GI = np.vstack((Gu, Gs, Gt))
+
         # covariant base vectors (current system)
 
-        gs = node1.getDeformedPos() - node0.getDeformedPos()
-        gt = node2.getDeformedPos() - node0.getDeformedPos()
-        gu = -gs - gt
+        X = self.node_table.getDeformedPos(self.node_idx)[:, :self.ndim]
 
-        # metric (current system)
-        gcov = np.vstack((gs, gt))
-        gIJ = gcov @ gcov.T
+        gs = X[1] - X[0]
+        gt = X[2] - X[0]
 
         # deformation gradient
         F = np.outer(gs, Gs) + np.outer(gt, Gt)
 
         # strain
-        eps = 0.5 * ( F + F.T ) - np.eye(np.size(gs))
+        eps = 0.5 * ( F + F.T ) - self._I2
 
         # update the material state
         strain = {'xx':eps[0,0], 'yy':eps[1,1], 'xy':eps[0,1]+eps[1,0]}
@@ -110,44 +119,26 @@ class Triangle(Element):
         # stress
         self.stress = self.material.getStress()
 
-        S = np.array( [[self.stress['xx'],self.stress['xy']],[self.stress['xy'],self.stress['yy']]] )
+        S = self.material.getStressMatrix(self.S_buf)
 
-        # tractions
-        ts = S @ Gs
-        tt = S @ Gt
-        tu = S @ Gu
+        # internal force: tractions times area
+        np.matmul(GI, S, out=self.Forces)
+        self.Forces *= self.area
 
-        # initialize arrays
+        # compute the kinematic matrices for all three nodes at once
         gx = Gs[0] * gs + Gt[0] * gt
         gy = Gs[1] * gs + Gt[1] * gt
 
-        # compute the kinematic matrices
-        GI = (Gu, Gs, Gt)
-
-        Bu = [Gu[0]*gx, Gu[1]*gy, Gu[1]*gx + Gu[0]*gy]
-        Bs = [Gs[0]*gx, Gs[1]*gy, Gs[1]*gx + Gs[0]*gy]
-        Bt = [Gt[0]*gx, Gt[1]*gy, Gt[1]*gx + Gt[0]*gy]
-
-        BI = ( np.array(Bu), np.array(Bs), np.array(Bt) )
-
-        # internal force
-        self.Forces = [
-            tu * self.area,
-            ts * self.area,
-            tt * self.area
-            ]
+        B = self._B
+        np.multiply.outer(GI[:,0], gx, out=B[:,0])
+        np.multiply.outer(GI[:,1], gy, out=B[:,1])
+        B[:,2]  = np.multiply.outer(GI[:,1], gx)
+        B[:,2] += np.multiply.outer(GI[:,0], gy)
 
         # tangent stiffness
         Ct = self.material.getStiffness() * self.area
-
-        Kt = []
-        for Gi, Bi in zip(GI, BI):
-            Krow = []
-            for Gj, Bj in  zip(GI, BI):
-                Krow.append( Bi.T @ Ct @ Bj )
-            Kt.append( Krow )
-
-        self.Kt = Kt
+        DB = np.einsum('kl,blj->bkj', Ct, B)
+        np.einsum('aki,bkj->abij', B, DB, out=self.Kt)
 
         # .. applied element load (reference load)
         self.computeSurfaceLoads()
@@ -160,30 +151,21 @@ class Triangle(Element):
         element supporting surface loads
 
         """
-        self.Loads = [ np.zeros_like(self.Forces[I]) for I in range(len(self.nodes)) ]
+        self.Loads.fill(0.0)
 
         for I, face in enumerate(self.faces):
+            # skip unloaded faces
+            if not any(face.load):
+                continue
+
             loads = face.computeNodalForces()
 
-            # indexing
-            J = I+1
-            if J>2:
-                J -= 3
+            # face I runs from node I to node I+1
+            J = (I+1) % 3
 
             # add to element load vectors
             self.Loads[I] += loads[0]
             self.Loads[J] += loads[1]
-            if loads.shape[0]>2:
-                numNodes = len(self.nodes)
-                if numNodes == 6:
-                    K = I + 3
-                elif numNodes == 8 or numNodes == 9:
-                    K = I + 4
-                else:
-                    msg = "Force data provided from Face2D inconsistent with element data"
-                    raise TypeError(msg)
-
-                self.Loads[K] += loads[2]
 
     def getStress(self):
         return self.Stress
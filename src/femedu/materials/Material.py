@@ -73,6 +73,21 @@ class Material():
         """
         return self.stress
 
+    def getStressMatrix(self, S_out=None):
+        """
+        request the in-plane stress as a 2x2 tensor
+
+        :param S_out: optional preallocated 2x2 array to be filled in place
+        :return: 2x2 stress tensor (**S_out** if provided)
+        """
+        if S_out is None:
+            S_out = np.empty((2,2))
+        S_out[0,0] = self.stress['xx']
+        S_out[0,1] = self.stress['xy']
+        S_out[1,0] = self.stress['xy']
+        S_out[1,1] = self.stress['yy']
+        return S_out
+
     def getStiffness(self):
         """
         request axial stiffness
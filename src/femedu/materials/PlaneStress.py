@@ -79,6 +79,92 @@ class PlaneStress(Material):
     def getStrain(self):
         return self.strain
 
+    def getStressMatrix(self, S_out=None):
+        """
+        request the in-plane stress as a 2x2 tensor
+
+        :param S_out: optional preallocated 2x2 array to be filled in place
+        :return: 2x2 stress tensor (**S_out** if provided)
+        """
+        if S_out is None:
+            S_out = np.empty((2,2))
+        (sxx, syy, sxy) = self.sig
+        S_out[0,0] = sxx
+        S_out[0,1] = sxy
+        S_out[1,0] = sxy
+        S_out[1,1] = syy
+        return S_out
+
+    @classmethod
+    def getElasticity_batch(cls, materials):
+        """
+        collect the elastic properties of a list of materials
+
+        :param materials: list of :py:class:`PlaneStress` objects
+        :returns: tuple of elastic stiffness (n,3,3), nu (n,), t (n,), and fy (n,) arrays
+        """
+        params = np.array([ (mat.parameters['E'], mat.parameters['nu'], mat.parameters['t'], mat.parameters['fy'])
+                            for mat in materials ])
+        E, nu, t, fy = params.T
+
+        Ce = np.zeros((len(materials), 3, 3))
+        Ce[:,0,0] = 1.
+        Ce[:,0,1] = nu
+        Ce[:,1,0] = nu
+        Ce[:,1,1] = 1.
+        Ce[:,2,2] = (1. - nu)/2.
+        Ce *= (E*t/(1. - nu*nu))[:, np.newaxis, np.newaxis]
+
+        return Ce, nu, t, fy
+
+    @classmethod
+    def getStress_batch(cls, materials, strain, elastic=None):
+        """
+        vectorized state update for a list of materials
+
+        The elastic predictor is evaluated for all materials at once.
+        Materials reaching the yield surface are handed to the scalar :py:meth:`updateState`
+        to perform the plastic correction.
+
+        The state of every material is updated as if :code:`setStrain()` had been called.
+
+        :param materials: list of :py:class:`PlaneStress` objects
+        :param strain: array of shape (n,3) holding strain components (xx, yy, xy) for each material
+        :param elastic: elastic properties as returned by :py:meth:`getElasticity_batch`.
+                        Collected from **materials** if not provided.
+        :returns: stress (n,3) and tangent stiffness (n,3,3) arrays
+        """
+        if elastic is None:
+            elastic = cls.getElasticity_batch(materials)
+        Ce, nu, t, fy = elastic
+        Ct = Ce.copy()
+
+        plastic_strain = np.array([ mat.plastic_strain for mat in materials ])
+
+        Phi = np.array([[2.,-1.,0.],[-1.,2.,0.],[0.,0.,6.]])
+
+        # elastic predictor
+        stress = np.einsum('eij,ej->ei', Ct, strain - plastic_strain)
+
+        # check yield condition
+        f = np.einsum('ei,ij,ej->e', stress, Phi, stress) / 2. - (t*fy)**2
+
+        for k, mat in enumerate(materials):
+            eps = {'xx':strain[k,0], 'yy':strain[k,1], 'xy':strain[k,2]}
+            if f[k] >= 0.0:
+                # plastic corrector as needed
+                mat.setStrain(eps)
+                stress[k] = mat.sig
+                Ct[k]     = mat.Et
+            else:
+                eps['zz']  = -nu[k] * (strain[k,0] + strain[k,1])  # elastic thickness strain
+                mat.strain = eps
+                mat.Et     = Ct[k]
+                mat.sig    = stress[k]
+                mat.stress = {'xx':stress[k,0], 'yy':stress[k,1], 'zz':0.0, 'xy':stress[k,2], 'yz':0.0, 'zx':0.0}
+
+        return stress, Ct
+
     def converged(self):
         # update state now that the global analysis has converged
         E  = self.parameters['E']
@@ -27,6 +27,7 @@ class Solver():
         self.nodes       = []       # list of node pointers
         self.constraints = []       # list of constraint pointers
         self.sdof = 0               # number of DOFs in the current system
+        self._numbering  = None     # global d.o.f. numbering used by elements' cached indices
 
         # numeric iteration tolerance
         self.TOL = 1.0e-6
@@ -47,6 +48,20 @@ class Solver():
         self.nodes       = nodes
         self.elements    = elems
         self.constraints = constraints
+        self._numbering  = None
+
+    def _checkNumbering(self, ndof):
+        """
+        Let elements drop cached global d.o.f. indices if the global numbering has changed
+        since the last assembly.
+
+        :param ndof: number of system d.o.f.s
+        """
+        numbering = (ndof, tuple( node.start if node.isLead() else None for node in self.nodes ))
+        if numbering != self._numbering:
+            for element in self.elements:
+                element.resetGlobalDofs()
+            self._numbering = numbering
 
     def fetchState(self):
         """
@@ -152,7 +167,7 @@ class Solver():
         """
         activate displacement control for the next load step
         """
-        if dof in node.dofs:
+        if node.hasDOF(dof):
             self.hasConstraint = True
             self.control_node  = node
             self.control_dof   = dof
@@ -194,6 +209,7 @@ class Solver():
             ndof += constraint.countConditions()
 
         self.sdof = ndof  # number of system d.o.f.s
+        self._checkNumbering(ndof)
 
         Psys = np.zeros(ndof)           # reference load vector (without load factor)
         Fsys = np.zeros(ndof)           # system internal force vector
@@ -217,12 +233,14 @@ class Solver():
                 idx = node.getIdx4DOFs()
                 Psys[idx] += node.getLoad()
 
+        # Element State Update occurs here
+        self.model_ptr.updateState()
+
         # Element Loop: assemble element forces and stiffness
         for element in self.elements:
-            Fe = element.getForce()     # Element State Update occurs here
-            Pe = element.getLoad()      # Element State Update occurs here
-            for (i,ndI) in enumerate(element.nodes):
-                idxK = ndI.getIdx4Element(element)
+            Fe = element.Forces
+            Pe = element.getLoad()
+            for (i,idxK) in enumerate(element.getGlobalDofs(per_node=True)):
 
                 # system reference load vector
                 if isinstance(Pe[i], np.ndarray):
@@ -231,11 +249,10 @@ class Solver():
                 # system residual force vector
                 Fsys[idxK] += Fe[i]
 
-                # system tangent stiffness matrix
-                if not force_only:
-                    for (j,ndJ) in enumerate(element.nodes):
-                        idxM = ndJ.getIdx4Element(element)
-                        Ksys[idxK[:, np.newaxis], idxM] += element.Kt[i][j]
+            # system tangent stiffness matrix
+            if not force_only:
+                rows, cols = element.getCOOIndices()
+                np.add.at(Ksys, (rows, cols), element.getKtMatrix().ravel())
 
         # system residual force vector
         self.P = Psys
@@ -243,15 +260,11 @@ class Solver():
 
         # apply boundary conditions
         if not force_only:
-            for node in self.nodes:
-                for dof in node.dofs:
-                    if node.isFixed(dof):
-                        #idx = node.lead.start + node.dofs[dof]
-                        idx = node.getIdx4DOFs(dofs=[dof])[0]
-                        self.R[idx]    = 0.0
-                        Ksys[:, idx]   = np.zeros(ndof)   # the range might need adjustment for constraints
-                        Ksys[idx, :]   = np.zeros(ndof)   # the range might need adjustment for constraints
-                        Ksys[idx, idx] = 1.0e3
+            fixed = self.model_ptr.build_fixed_mask(ndof)
+            self.R[fixed]        = 0.0
+            Ksys[:, fixed]       = 0.0   # the range might need adjustment for constraints
+            Ksys[fixed, :]       = 0.0   # the range might need adjustment for constraints
+            Ksys[fixed, fixed]   = 1.0e3
 
             self.Kt = Ksys
 
@@ -452,11 +465,11 @@ class Solver():
 
             reaction = np.zeros(3)
 
-            if 'ux' in node.dofs:
+            if node.hasDOF('ux'):
                 reaction[0] = self.R[node.getIdx4DOFs(dofs=['ux'])]
-            if 'uy' in node.dofs:
+            if node.hasDOF('uy'):
                 reaction[1] = self.R[node.getIdx4DOFs(dofs=['uy'])]
-            if 'rz' in node.dofs:
+            if node.hasDOF('rz'):
                 reaction[2] = self.R[node.getIdx4DOFs(dofs=['rz'])]
 
             if np.linalg.norm(reaction) <= cut_off:
@@ -133,9 +133,11 @@ class SparseSolver(NewtonRaphsonSolver):
             ndof += constraint.countConditions()
 
         self.sdof = ndof  # number of system d.o.f.s
+        self._checkNumbering(ndof)
 
         Rsys = np.zeros(ndof)
 
+        # stiffness triplets (COO format), one array per element
         rows = []
         cols = []
         data = []
@@ -146,39 +148,37 @@ class SparseSolver(NewtonRaphsonSolver):
                 idx = node.start + np.arange(node.ndofs)
                 Rsys[idx] += node.getLoad() * self.loadfactor
 
+        # Element State Update occurs here
+        self.model_ptr.updateState()
+
         # Element Loop: assemble element forces and stiffness
         for element in self.elements:
-            Fe = element.getForce()     # Element State Update occurs here
-            Pe = element.getLoad()      # Element State Update occurs here
-            for (i,ndI) in enumerate(element.nodes):
-                idxK = ndI.start + np.arange(ndI.ndofs)
+            Fe = element.Forces
+            Pe = element.getLoad()
+            for (i,idxK) in enumerate(element.getGlobalDofs(per_node=True)):
                 if isinstance(Pe[i], np.ndarray):
                     Rsys[idxK] -= Fe[i] - self.loadfactor * Pe[i]
                 else:
                     Rsys[idxK] -= Fe[i]
-                if not force_only:
-                    for (j,ndJ) in enumerate(element.nodes):
-                        idxM = ndJ.start + np.arange(ndJ.ndofs)
-                        KIJ = element.Kt[i][j]
-                        II,JJ = KIJ.shape
-                        for p in range(II):
-                            for q in range(JJ):
-                                rows.append(idxK[p])
-                                cols.append(idxM[q])
-                                data.append(KIJ[p][q])
+
+            if not force_only:
+                rowsK, colsK = element.getCOOIndices()
+                rows.append(rowsK)
+                cols.append(colsK)
+                data.append(element.getKtMatrix().ravel())
 
         # apply boundary conditions
         if not force_only:
-            for node in self.nodes:
-                for dof in node.dofs:
-                    if node.isFixed(dof):
-                        idx = node.start + node.dofs[dof]
-                        Rsys[idx]      = 0.0
-                        rows.append(idx)
-                        cols.append(idx)
-                        data.append(1.0e30)
+            fixed = np.nonzero(self.model_ptr.build_fixed_mask(ndof))[0]
+            Rsys[fixed] = 0.0
+            rows.append(fixed)
+            cols.append(fixed)
+            data.append(np.full(fixed.size, 1.0e30))
 
         self.R  = Rsys
 
-        KtS = scs.coo_array((data, (rows, cols)), shape=(self.sdof,self.sdof))
-        self.Kt = scs.csc_array(KtS)
+        if not force_only:
+            # one-shot conversion; duplicate entries are summed
+            KtS = scs.coo_array((np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+                                shape=(self.sdof,self.sdof))
+            self.Kt = KtS.tocsc()